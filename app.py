@@ -1,10 +1,29 @@
-from shiny import App, ui, render, reactive
+from shiny import App, ui, render, reactive, req
 import pandas as pd
 import numpy as np
+import matplotlib
+# Plots are only ever rendered to PNG on the server.
+matplotlib.use("Agg")
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+})
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.lines import Line2D
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
 from pathlib import Path
 import os
+import functools
+import json
+import io
+from collections import OrderedDict
+import PIL.Image
+
+plt.ioff()
 
 # ---------- Font setup ----------
 font_path = os.path.join(os.getcwd(), "Clarendon Bold.otf")
@@ -14,6 +33,380 @@ if os.path.exists(font_path):
 else:
     clarendon = None
 
+# ---------- Data ----------
+YN_BOOL_COLS = {
+    "men_bool": "men",
+    "victory_bool": "victory_win_won",
+    "fight_bool": "fight",
+    "rah_bool": "rah",
+    "nonsense_bool": "nonsense",
+    "colors_bool": "colors",
+    "opponents_bool": "opponents",
+}
+
+# (series key, decade_props() column, legend label, line color) for the
+# by-decade plot, in legend order.
+DECADE_SERIES = [
+    ("men", "men_bool", "Men", "lightcoral"),
+    ("victory", "victory_bool", "Victory / Win / Won", "orange"),
+    ("fight", "fight_bool", "Fight", "lightskyblue"),
+    ("rah", "rah_bool", "Rah", "gold"),
+    ("nonsense", "nonsense_bool", "Nonsense", "turquoise"),
+    ("colors", "colors_bool", "Colors", "mediumpurple"),
+    ("opponents", "opponents_bool", "Opponents", "orchid"),
+]
+
+# Every column the app reads; the rest of the CSV is skipped at parse time.
+FIGHT_SONGS_COLS = [
+    "year", "conference", "student_writer", "contest",
+    "men", "victory_win_won", "fight", "rah", "nonsense",
+    "colors", "opponents", "spelling",
+]
+
+FIGHT_SONGS_PATH = Path(__file__).parent / "fight-songs.csv"
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+# Bump whenever _parse_fight_songs() changes the shape of its output.
+PARQUET_CACHE_VERSION = 5
+PARQUET_CACHE = CACHE_DIR / "fight-songs.parquet"
+PARQUET_CACHE_META = CACHE_DIR / "fight-songs.json"
+
+
+def _parse_fight_songs(path):
+    # Every column but year is a handful of repeated labels (conferences,
+    # Yes/No answers), so read them as categoricals: each label is parsed
+    # once and groupby/comparisons work on integer codes.
+    dtypes = {c: "category" for c in FIGHT_SONGS_COLS}
+    dtypes["year"] = "string"
+    d = pd.read_csv(path, usecols=FIGHT_SONGS_COLS, dtype=dtypes, engine="c")
+    # Years are plain four-digit strings; anything else ("Unknown") is dropped.
+    d["year"] = pd.to_numeric(d["year"], errors="coerce")
+    d = d.dropna(subset=["year"])
+    # Years and decades comfortably fit in int16.
+    d["year"] = d["year"].astype(np.int16)
+    d["decade"] = (d["year"] // 10) * 10
+
+    def yn_to_bool(s):
+        # Normalise the category labels rather than every cell; the trailing
+        # False is what missing values (code -1) pick up before masking.
+        # Labels other than yes/no stay NA, like missing values.
+        labels = s.cat.categories.astype("string").str.strip().str.casefold()
+        is_yes = np.append(labels == "yes", False)
+        valid = np.append(labels.isin(["yes", "no"]), False)
+        codes = s.cat.codes.to_numpy()
+        return pd.Series(pd.arrays.BooleanArray(is_yes[codes], ~valid[codes]), index=s.index)
+
+    bools = d[list(YN_BOOL_COLS.values())].apply(yn_to_bool)
+    bools.columns = list(YN_BOOL_COLS)
+    d = pd.concat([d, bools], axis=1)
+
+    return d
+
+
+# The preprocessed frame is persisted as Parquet next to a small JSON stamp
+# holding the CSV's mtime (in ns). Parquet needs pyarrow; without it,
+# or on a read-only filesystem, we just fall back to parsing the CSV.
+def _read_parquet_cache(csv_mtime_ns):
+    try:
+        meta = json.loads(PARQUET_CACHE_META.read_text())
+        if meta.get("csv_mtime_ns") != csv_mtime_ns or meta.get("version") != PARQUET_CACHE_VERSION:
+            return None
+        return pd.read_parquet(PARQUET_CACHE, engine="pyarrow", memory_map=True)
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _write_parquet_cache(d, csv_mtime_ns):
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        d.to_parquet(PARQUET_CACHE, engine="pyarrow")
+        PARQUET_CACHE_META.write_text(json.dumps({"csv_mtime_ns": csv_mtime_ns, "version": PARQUET_CACHE_VERSION}))
+    except (ImportError, OSError, ValueError):
+        pass
+
+
+# Parsed once per process and shared by every session; treat as read-only.
+@functools.lru_cache(maxsize=1)
+def _load_fight_songs():
+    try:
+        csv_mtime_ns = FIGHT_SONGS_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    d = _read_parquet_cache(csv_mtime_ns)
+    if d is None:
+        d = _parse_fight_songs(FIGHT_SONGS_PATH)
+        _write_parquet_cache(d, csv_mtime_ns)
+
+    return d
+
+# Trope flags packed into contiguous (songs x tropes) uint8 matrices, columns
+# in YN_BOOL_COLS order, alongside each song's decade.
+@functools.lru_cache(maxsize=1)
+def _trope_matrix():
+    d = _load_fight_songs()
+    if d is None:
+        return None
+
+    flags = d[list(YN_BOOL_COLS)]
+    said_yes = flags.fillna(False).to_numpy(dtype=np.uint8)
+    answered = flags.notna().to_numpy(dtype=np.uint8)
+    return d["decade"].to_numpy(), said_yes, answered
+
+# Column sums of m (rows x tropes) within each of n_groups integer codes.
+# Each (group, column) cell gets its own bin, so a single weighted bincount
+# over the flattened matrix replaces a pandas groupby with no Python loop.
+def _group_sums(codes, m, n_groups):
+    n_cols = m.shape[1]
+    bins = (codes[:, None] * n_cols + np.arange(n_cols)).ravel()
+    sums = np.bincount(bins, weights=m.ravel(), minlength=n_groups * n_cols)
+    return sums.reshape(n_groups, n_cols)
+
+# Per-conference trope proportions and song counts. Pure function of the
+# shared data, so it is computed once per process.
+@functools.lru_cache(maxsize=1)
+def _conf_tables():
+    d = _load_fight_songs()
+    if d is None:
+        return None
+
+    decades, said_yes, answered = _trope_matrix()
+    conferences = d["conference"].cat.categories
+    codes = d["conference"].cat.codes.to_numpy()
+
+    # Only songs with a conference and every trope answered are counted.
+    keep = (codes >= 0) & answered.all(axis=1)
+    if not keep.any():
+        return None
+
+    codes = codes[keep]
+    counts = np.bincount(codes, minlength=len(conferences))
+    # Per-conference trope counts as one (conferences x songs) one-hot
+    # matmul against the (songs x tropes) flag matrix.
+    onehot = np.zeros((len(conferences), len(codes)))
+    onehot[codes, np.arange(len(codes))] = 1
+    sums = onehot @ said_yes[keep]
+    present = counts > 0
+
+    conf_trope = pd.DataFrame(
+        sums[present] / counts[present, None],
+        index=pd.Index(conferences[present], name="conference"),
+        columns=list(YN_BOOL_COLS),
+    ).rename(columns={
+        "victory_bool": "Victory/Win/Won",
+        "fight_bool": "Fight",
+        "rah_bool": "Rah",
+        "nonsense_bool": "Nonsense",
+        "men_bool": "Men",
+        "colors_bool": "Colors",
+        "opponents_bool": "Opponents",
+    })
+
+    conf_counts = (
+        pd.Series(counts[present], index=conf_trope.index)
+        .sort_values(ascending=False)
+    )
+    top5 = conf_counts.head(5).index.tolist()
+
+    return conf_trope, conf_counts, top5
+
+# Trope proportions split by student authorship and by contest selection.
+@functools.lru_cache(maxsize=1)
+def _student_contest_props():
+    data = _load_fight_songs()
+    if data is None:
+        return None
+
+    tropes = ["fight", "victory_win_won", "rah", "nonsense",
+              "colors", "men", "opponents", "spelling"]
+    cols = ["student_writer", "contest"] + tropes
+    mask = data[cols].isin(["Yes", "No"]).all(axis=1)
+    # The shared frame is never written to; the masked 0/1 trope table is
+    # grouped directly by the masked key columns.
+    said_yes = (data.loc[mask, tropes] == "Yes").astype(np.int8)
+
+    # One factorization and reduction per grouping key.
+    by_student = said_yes.groupby(data.loc[mask, "student_writer"], observed=True).mean()
+    by_contest = said_yes.groupby(data.loc[mask, "contest"], observed=True).mean()
+
+    return {
+        "student": by_student.loc["Yes"],
+        "nonstudent": by_student.loc["No"],
+        "contest": by_contest.loc["Yes"],
+        "noncontest": by_contest.loc["No"],
+        "tropes": tropes
+    }
+
+# Full per-decade table has no slider dependency, so it is computed once and
+# _decade_props() only slices it; each slider position is memoized too.
+@functools.lru_cache(maxsize=1)
+def _decade_props_full():
+    tm = _trope_matrix()
+    if tm is None:
+        return None
+
+    decades, said_yes, answered = tm
+    codes, uniq = pd.factorize(decades, sort=True)
+
+    # Unanswered cells stay out of both numerator and denominator.
+    props = _group_sums(codes, said_yes, len(uniq)) / _group_sums(codes, answered, len(uniq))
+
+    return pd.DataFrame(props, index=pd.Index(uniq, name="decade"), columns=list(YN_BOOL_COLS))
+
+
+@functools.lru_cache(maxsize=16)
+def _decade_props(min_decade):
+    full = _decade_props_full()
+    if full is None:
+        return None
+
+    # The decade index is sorted, so the visible window is a suffix slice.
+    return full.iloc[full.index.searchsorted(min_decade):]
+
+# ---------- DECADE CONTEXT ----------
+DECADE_CONTEXT = {
+    1890: "Late 19th century: Universities were formalizing traditions, including fight songs, mascots, and sporting events. College culture emphasized classical education, discipline, and the beginnings of organized football programs.",
+    1900: "Progressive Era in the United States: Reform movements sought to address social issues like labor conditions, women's suffrage, and education. College life grew more structured, and intercollegiate sports became increasingly popular. The 'Men' trope reaches a global maximum in this decade and quickly declines in following years, which is indicative of changes in gender norms.",
+    1910: "World War I period: Global tensions and the outbreak of war influenced American society. Colleges contributed to military training, and patriotic themes became common in student life and song lyrics, which illustrates how the 'Fight' trope is on the rise.",
+    1920: "Roaring Twenties: Economic prosperity and cultural dynamism characterized the decade. Jazz, flappers, and new forms of entertainment emerged, and college campuses embraced spirited events, football, and lively social traditions.",
+    1930: "Great Depression: Economic hardship shaped everyday life. Despite financial challenges, colleges maintained traditions, with fight songs often reflecting resilience and community pride in difficult times. All songs use the 'Fight' trope here.",
+    1940: "World War II: American involvement affected campus populations as many students joined the military. College events, songs, and sports often incorporated patriotic themes, morale-building, and support for the war effort.",
+    1950: "Post-war boom and Cold War beginnings: Returning veterans fueled campus growth through the GI Bill. Colleges expanded, football and other sports flourished, and societal optimism mixed with the tension of emerging Cold War politics. The 'Fight' and 'Victory' tropes fall while the use of opponents in fight songs starts to rise.",
+    1960: "Civil Rights Movement and social change: Activism and social justice influenced campuses nationwide. Music, including fight songs and student performances, reflected changing attitudes, while traditional college traditions coexisted with broader societal transformation.",
+
+}
+
+# ---------- Conferences ----------
+CONF_COLORS = {
+    "ACC": "#A5A9AB",
+    "Big Ten": "#0088CE",
+    "Big 12": "#C8102E",
+    "Pac-12": "#092346",
+    "SEC": "#FBCE28",
+}
+
+CONF_LOGOS = {
+    "ACC": "logos/acc.png",
+    "Big Ten": "logos/bigten.png",
+    "Big 12": "logos/big12.png",
+    "Pac-12": "logos/pac12.png",
+    "SEC": "logos/sec.png",
+}
+
+@functools.lru_cache(maxsize=16)
+def conf_label(conf_name: str) -> str:
+    src = CONF_LOGOS.get(conf_name, "")
+    if src:
+        return f"""
+        <div style="display:flex; align-items:center; gap:10px;">
+        <img src="{src}"
+            style="
+            height:50px;
+            width:50px;
+            object-fit: contain;
+            ">
+        <span>{conf_name}</span>
+        </div>
+        """
+    return conf_name
+
+# ---------- Radar geometry ----------
+# Closed-polygon angles and theta-grid positions for an n-axis radar plot.
+# The arrays are shared between calls, so they are made read-only.
+@functools.lru_cache(maxsize=8)
+def _radar_angles(n_dims):
+    angles = np.linspace(0, 2*np.pi, n_dims, endpoint=False)
+    closed = np.r_[angles, angles[0]]
+    degrees = np.degrees(angles)
+    closed.setflags(write=False)
+    degrees.setflags(write=False)
+    return closed, degrees
+
+# ---------- Plot rendering ----------
+# Rendered PNGs keyed by everything a plot depends on (inputs, output size,
+# pixel ratio). The data is fixed for the process, so entries are shared by
+# all sessions and toggling back to an earlier selection skips matplotlib.
+PLOT_CACHE_SIZE = 32
+_plot_png_cache = OrderedDict()
+
+
+def _fig_to_png(fig, width, height, pixelratio):
+    # Size and dpi are set explicitly on every render, so figures that are
+    # reused across renders never inherit a previous render's dpi.
+    ppi = plt.rcParams["figure.dpi"]
+    fig.set_dpi(ppi)
+    fig.set_size_inches(width / ppi, height / ppi)
+    fig.tight_layout()
+    with io.BytesIO() as buf:
+        fig.savefig(buf, format="png", dpi=ppi * pixelratio)
+        return buf.getvalue()
+
+
+def _cached_plot(key, draw):
+    png = _plot_png_cache.get(key)
+    if png is None:
+        png = draw()
+        _plot_png_cache[key] = png
+        if len(_plot_png_cache) > PLOT_CACHE_SIZE:
+            _plot_png_cache.popitem(last=False)
+    else:
+        _plot_png_cache.move_to_end(key)
+    return PIL.Image.open(io.BytesIO(png))
+
+# Eighth-note line marker, parsed from mathtext once and centred on the
+# origin so it sits exactly where the "$\u266A$" marker string did.
+def _centered_text_marker(s):
+    text = TextPath((0, 0), s)
+    bbox = text.get_extents()
+    return text.transformed(Affine2D().translate(-bbox.x0 - bbox.width / 2,
+                                                 -bbox.y0 - bbox.height / 2))
+
+
+NOTE_MARKER = _centered_text_marker("$\u266A$")
+
+# The "by decade" field, axes and one line per trope are built once per
+# process and shared by every session: renders run one at a time on the
+# event loop and each one sets the data, visibility and legend it needs
+# before saving, so no state leaks between sessions. Later renders only swap
+# line data and visibility, and redraw the yard lines when the set of
+# decades changes.
+_plot2_cache = {}
+
+
+def _build_plot2():
+    fig, ax = plt.subplots(figsize=(12, 4.8))
+    fig.patch.set_facecolor("#376f32")
+    ax.set_facecolor("#376f32")
+
+    lines = {}
+    for key, _, label, color in DECADE_SERIES:
+        lines[key], = ax.plot([], [], marker=NOTE_MARKER, label=label,
+                              color=color, markersize=12)
+
+    ax.set_ylim(-0.05, 1.05)
+    ax.set_xlabel("Decade", color="white")
+    ax.set_ylabel("Proportion of songs using each trope", color="white")
+    ax.tick_params(colors="white")
+
+    _plot2_cache.update(fig=fig, ax=ax, lines=lines, yard_lines=[], decades=None)
+
+# The conference radar works the same way: one polar frame plus one fill
+# collection and one outline collection per process, and renders only swap
+# their polygons.
+_radar_cache = {}
+
+
+def _build_radar():
+    fig, ax = plt.subplots(figsize=(6.2, 6.2), subplot_kw=dict(polar=True))
+    ax.set_ylim(0, 1)
+    ax.grid(alpha=0.35)
+    fills = PolyCollection([], alpha=0.18)
+    outlines = LineCollection([], linewidths=2)
+    ax.add_collection(fills, autolim=False)
+    ax.add_collection(outlines, autolim=False)
+    _radar_cache.update(fig=fig, ax=ax, fills=fills, outlines=outlines,
+                        values={}, dims=None)
+
 # ---------- UI ----------
 app_ui = ui.page_navbar(
 
@@ -179,61 +572,19 @@ app_ui = ui.page_navbar(
 # ---------- Server ----------
 def server(input, output, session):
 
-    # ---------- Load data ----------
-    @reactive.Calc
-    def fight_songs_data():
-        path = Path("fight-songs.csv")
-        if not path.exists():
-            return None
-
-        d = pd.read_csv(path)
-        d["year"] = d["year"].astype(str).str.extract(r"(\d{4})")[0].astype(float)
-        d = d.dropna(subset=["year"])
-        d["year"] = d["year"].astype(int)
-        d["decade"] = (d["year"] // 10) * 10
-
-        def yn_to_bool(s):
-            return s.astype(str).str.strip().str.lower().map({"yes": True, "no": False})
-
-        d["men_bool"] = yn_to_bool(d["men"])
-        d["victory_bool"] = yn_to_bool(d["victory_win_won"])
-        d["fight_bool"] = yn_to_bool(d["fight"])
-        d["rah_bool"] = yn_to_bool(d["rah"])
-        d["nonsense_bool"] = yn_to_bool(d["nonsense"])
-        d["colors_bool"] = yn_to_bool(d["colors"])
-        d["opponents_bool"] = yn_to_bool(d["opponents"])
-
-        return d
+    # ---------- Plot size ----------
+    # Container size and pixel ratio of the output being rendered; part of
+    # every rendered-plot cache key.
+    def plot_size():
+        width = session.clientdata.output_width()
+        height = session.clientdata.output_height()
+        req(width, height)
+        return width, height, session.clientdata.pixelratio()
 
     # ---------- Student / Contest Proportions ----------
     @reactive.Calc
     def student_contest_props():
-        data = fight_songs_data()
-        if data is None:
-            return None
-
-        tropes = ["fight", "victory_win_won", "rah", "nonsense",
-                  "colors", "men", "opponents", "spelling"]
-        cols = ["student_writer", "contest"] + tropes
-        data = data[cols]
-        data = data[data["student_writer"].isin(["Yes", "No"])]
-        data = data[data["contest"].isin(["Yes", "No"])]
-
-        for trope in tropes:
-            data = data[data[trope].isin(["Yes", "No"])]
-            data[trope] = data[trope].map({"Yes": 1, "No": 0})
-
-        def trope_props(df_group, group_col, group_val):
-            subset = df_group[df_group[group_col] == group_val]
-            return subset[tropes].mean()
-
-        return {
-            "student": trope_props(data, "student_writer", "Yes"),
-            "nonstudent": trope_props(data, "student_writer", "No"),
-            "contest": trope_props(data, "contest", "Yes"),
-            "noncontest": trope_props(data, "contest", "No"),
-            "tropes": tropes
-        }
+        return _student_contest_props()
 
     # ---------- Student / Contest Plot ----------
     @output
@@ -246,59 +597,42 @@ def server(input, output, session):
             ax.set_axis_off()
             return fig
 
-        x = np.arange(len(props["tropes"]))
-        width = 0.35
-        palette = ["#228B22", "#8FBC8B", "#ef6351", "#fbc3bc"]
-
-        fig, ax = plt.subplots(figsize=(10, 6))
-
-        if plot_type == "student":
-            ax.bar(x - width / 2, props["student"], width, label="Student-written", color=palette[0])
-            ax.bar(x + width / 2, props["nonstudent"], width, label="Non-student-written", color=palette[1])
-            ax.set_title("Trope Usage by Student Authorship")
-        else:  # contest
-            ax.bar(x - width / 2, props["contest"], width, label="Contest-selected", color=palette[2])
-            ax.bar(x + width / 2, props["noncontest"], width, label="Non-contest", color=palette[3])
-            ax.set_title("Trope Usage by Contest Selection")
-
-        ax.set_xticks(x)
-        ax.set_xticklabels(props["tropes"], rotation=30, ha="right")
-        ax.set_ylabel("Proportion of Songs")
-        ax.legend()
-        fig.tight_layout()
-        return fig
-
-    # ---------- DECADE CONTEXT ----------
-    DECADE_CONTEXT = {
-        1890: "Late 19th century: Universities were formalizing traditions, including fight songs, mascots, and sporting events. College culture emphasized classical education, discipline, and the beginnings of organized football programs.",
-        1900: "Progressive Era in the United States: Reform movements sought to address social issues like labor conditions, women's suffrage, and education. College life grew more structured, and intercollegiate sports became increasingly popular. The 'Men' trope reaches a global maximum in this decade and quickly declines in following years, which is indicative of changes in gender norms.",
-        1910: "World War I period: Global tensions and the outbreak of war influenced American society. Colleges contributed to military training, and patriotic themes became common in student life and song lyrics, which illustrates how the 'Fight' trope is on the rise.",
-        1920: "Roaring Twenties: Economic prosperity and cultural dynamism characterized the decade. Jazz, flappers, and new forms of entertainment emerged, and college campuses embraced spirited events, football, and lively social traditions.",
-        1930: "Great Depression: Economic hardship shaped everyday life. Despite financial challenges, colleges maintained traditions, with fight songs often reflecting resilience and community pride in difficult times. All songs use the 'Fight' trope here.",
-        1940: "World War II: American involvement affected campus populations as many students joined the military. College events, songs, and sports often incorporated patriotic themes, morale-building, and support for the war effort.",
-        1950: "Post-war boom and Cold War beginnings: Returning veterans fueled campus growth through the GI Bill. Colleges expanded, football and other sports flourished, and societal optimism mixed with the tension of emerging Cold War politics. The 'Fight' and 'Victory' tropes fall while the use of opponents in fight songs starts to rise.",
-        1960: "Civil Rights Movement and social change: Activism and social justice influenced campuses nationwide. Music, including fight songs and student performances, reflected changing attitudes, while traditional college traditions coexisted with broader societal transformation.",
+        size = plot_size()
 
-    }
+        def draw():
+            x = np.arange(len(props["tropes"]))
+            width = 0.35
+            palette = ["#228B22", "#8FBC8B", "#ef6351", "#fbc3bc"]
 
-    # ---------- Decade Proportions ----------
-    @reactive.Calc
-    def decade_props():
-        d = fight_songs_data()
-        if d is None:
-            return None
+            fig, ax = plt.subplots(figsize=(10, 6))
 
-        d = d[d["decade"] >= input.min_decade()]
+            if plot_type == "student":
+                ax.bar(x - width / 2, props["student"], width, label="Student-written", color=palette[0])
+                ax.bar(x + width / 2, props["nonstudent"], width, label="Non-student-written", color=palette[1])
+                ax.set_title("Trope Usage by Student Authorship")
+            else:  # contest
+                ax.bar(x - width / 2, props["contest"], width, label="Contest-selected", color=palette[2])
+                ax.bar(x + width / 2, props["noncontest"], width, label="Non-contest", color=palette[3])
+                ax.set_title("Trope Usage by Contest Selection")
 
-        prop_men = d.groupby("decade")["men_bool"].mean()
-        prop_victory = d.groupby("decade")["victory_bool"].mean()
-        prop_fight = d.groupby("decade")["fight_bool"].mean()
-        prop_rah = d.groupby("decade")["rah_bool"].mean()
-        prop_nonsense = d.groupby("decade")["nonsense_bool"].mean()
-        prop_colors = d.groupby("decade")["colors_bool"].mean()
-        prop_opponents = d.groupby("decade")["opponents_bool"].mean()
+            ax.set_xticks(x)
+            ax.set_xticklabels(props["tropes"], rotation=30, ha="right")
+            ax.set_ylabel("Proportion of Songs")
+            ax.legend()
 
-        return prop_men, prop_victory, prop_fight, prop_rah, prop_nonsense, prop_colors, prop_opponents
+            png = _fig_to_png(fig, *size)
+            plt.close(fig)
+            return png
+
+        return _cached_plot(("student_contest", plot_type) + size, draw)
+
+    # ---------- Decade Proportions ----------
+    @reactive.Calc
+    def decade_props():
+        # input_slider values are already debounced in the browser (250 ms
+        # rate policy), so drags only arrive here once the handle settles;
+        # a second server-side debounce would just add latency.
+        return _decade_props(input.min_decade())
 
     # ---------- Available Decades ----------
     @reactive.Calc
@@ -306,31 +640,39 @@ def server(input, output, session):
         p = decade_props()
         if p is None:
             return []
-        return p[0].index.to_list()
+        return p.index.to_list()
 
     last_clicked_decade = reactive.Value(None)
+    decade_click_counts = {}
 
     # ---------- Buttons UI ----------
     @output
     @render.ui
     def decade_buttons():
-        buttons = []
-        for d in available_decades():
-            btn = ui.input_action_button(
+        buttons = [
+            ui.input_action_button(
                 f"decade_{d}",
                 label=f"{d}s",
                 class_="btn btn-outline-success btn-sm"
             )
-
-            @reactive.Effect
-            def _update(d=d):
-                if input[f"decade_{d}"]() > 0:
-                    last_clicked_decade.set(d)
-
-            buttons.append(btn)
+            for d in available_decades()
+        ]
 
         return ui.div(*buttons, style="display: flex; flex-wrap: wrap; gap: 6px;")
 
+    # One observer for every decade button; only the button whose click
+    # count changed since the last run becomes the selected decade.
+    @reactive.Effect
+    def _watch_decade_clicks():
+        for d in available_decades():
+            btn_id = f"decade_{d}"
+            if btn_id not in input:
+                continue
+            clicks = input[btn_id]()
+            if clicks > 0 and clicks != decade_click_counts.get(d):
+                last_clicked_decade.set(d)
+            decade_click_counts[d] = clicks
+
     @reactive.Calc
     def selected_decade():
         return last_clicked_decade.get()
@@ -359,91 +701,56 @@ def server(input, output, session):
             ax.set_axis_off()
             return fig
 
-        prop_men, prop_victory, prop_fight, prop_rah, prop_nonsense, prop_colors, prop_opponents = p
         selected = set(input.series())
-        decades_list = prop_men.index.to_list()
+        decades_list = p.index.to_list()
         x = np.arange(len(decades_list))
 
-        fig, ax = plt.subplots(figsize=(12, 4.8))
-        fig.patch.set_facecolor("#376f32")
-        ax.set_facecolor("#376f32")
-
-        # Yard lines
-        for i in x:
-            ax.axvline(i, color="white", alpha=0.3, linewidth=1)
-
-        BOLD_INTERVAL = 7
-        for i in x[::BOLD_INTERVAL]:
-            ax.axvline(i, color="white", alpha=0.7, linewidth=2)
-
-        # Lines
-        if "men" in selected:
-            ax.plot(x, prop_men.values, marker="$\u266A$", label="Men",
-                    color="lightcoral", markersize=12)
-        if "victory" in selected:
-            ax.plot(x, prop_victory.values, marker="$\u266A$", label="Victory / Win / Won",
-                    color="orange", markersize=12)
-        if "fight" in selected:
-            ax.plot(x, prop_fight.values, marker="$\u266A$", label="Fight",
-                    color="lightskyblue", markersize=12)
-        if "rah" in selected:
-            ax.plot(x, prop_rah.values, marker="$\u266A$", label="Rah",
-                    color="gold", markersize=12)
-        if "nonsense" in selected:
-            ax.plot(x, prop_nonsense.values, marker="$\u266A$", label="Nonsense",
-                    color="turquoise", markersize=12)
-        if "colors" in selected:
-            ax.plot(x, prop_colors.values, marker="$\u266A$", label="Colors",
-                    color="mediumpurple", markersize=12)
-        if "opponents" in selected:
-            ax.plot(x, prop_opponents.values, marker="$\u266A$", label="Opponents",
-                    color="orchid", markersize=12)
-
-        ax.set_xticks(x)
-        ax.set_xticklabels([str(d) for d in decades_list],
-                           fontproperties=clarendon, fontsize=18, color="white")
-        ax.set_ylim(-0.05, 1.05)
-        ax.set_xlim(-0.5, len(x) - 0.5)
-        ax.set_xlabel("Decade", color="white")
-        ax.set_ylabel("Proportion of songs using each trope", color="white")
-        ax.tick_params(colors="white")
-        ax.legend(loc='lower left', bbox_to_anchor=(1, 0.5))
-        fig.tight_layout()
-        return fig
+        size = plot_size()
 
-    # ---------- Plot by Conference ----------
-    CONF_COLORS = {
-    "ACC": "#A5A9AB",
-    "Big Ten": "#0088CE",
-    "Big 12": "#C8102E",
-    "Pac-12": "#092346",
-    "SEC": "#FBCE28",
-    }
+        def draw():
+            if not _plot2_cache:
+                _build_plot2()
+            fig, ax, lines = _plot2_cache["fig"], _plot2_cache["ax"], _plot2_cache["lines"]
 
-    CONF_LOGOS = {
-    "ACC": "logos/acc.png",
-    "Big Ten": "logos/bigten.png",
-    "Big 12": "logos/big12.png",
-    "Pac-12": "logos/pac12.png",
-    "SEC": "logos/sec.png",
-    }
+            if _plot2_cache["decades"] != decades_list:
+                for artist in _plot2_cache["yard_lines"]:
+                    artist.remove()
 
-    def conf_label(conf_name: str) -> str:
-        src = CONF_LOGOS.get(conf_name, "")
-        if src:
-            return f"""
-            <div style="display:flex; align-items:center; gap:10px;">
-            <img src="{src}"
-                style="
-                height:50px;
-                width:50px;
-                object-fit: contain;
-                ">
-            <span>{conf_name}</span>
-            </div>
-            """
-        return conf_name
+                # Yard lines: one collection per stroke style, spanning the full
+                # axes height like axvline (x in data, y in axes coordinates).
+                def yard_segments(xs):
+                    return [[(i, 0), (i, 1)] for i in xs]
+
+                BOLD_INTERVAL = 7
+                yard_lines = [
+                    LineCollection(yard_segments(x), colors="white", alpha=0.3,
+                                   linewidths=1, zorder=1, transform=ax.get_xaxis_transform()),
+                    LineCollection(yard_segments(x[::BOLD_INTERVAL]), colors="white", alpha=0.7,
+                                   linewidths=2, zorder=1, transform=ax.get_xaxis_transform()),
+                ]
+                for collection in yard_lines:
+                    ax.add_collection(collection, autolim=False)
 
+                for key, col, _, _ in DECADE_SERIES:
+                    lines[key].set_data(x, p[col].values)
+
+                ax.set_xticks(x)
+                ax.set_xticklabels([str(d) for d in decades_list],
+                                   fontproperties=clarendon, fontsize=18, color="white")
+                ax.set_xlim(-0.5, len(x) - 0.5)
+                _plot2_cache.update(yard_lines=yard_lines, decades=decades_list)
+
+            # Lines
+            for key, line in lines.items():
+                line.set_visible(key in selected)
+
+            ax.legend(handles=[line for line in lines.values() if line.get_visible()],
+                      loc='lower left', bbox_to_anchor=(1, 0.5))
+            return _fig_to_png(fig, *size)
+
+        return _cached_plot(("plot2", input.min_decade(), frozenset(selected)) + size, draw)
+
+    # ---------- Plot by Conference ----------
     @output
     @render.ui
     def conf_picker_ui():
@@ -479,26 +786,19 @@ def server(input, output, session):
         if not selected_confs:
             return ui.p("Select one or more conferences.")
 
+        # Emitted as one preformatted HTML string rather than a tree of
+        # ui.div/ui.p tags per conference.
         blocks = []
         for c in selected_confs:
             vals = conf_trope.loc[c]
-            n = int(conf_counts.get(c, 0))
-            blocks.append(
-                ui.div(
-                    ui.div(
-                        ui.HTML(conf_label(c)),
-                        style="margin-bottom:6px;"
-                    ),
-                    #ui.p(f"n = {n}", style="margin:0;"),
-                    ui.p(
-                        f"Victory {vals['Victory/Win/Won']:.2f} • Fight {vals['Fight']:.2f} • Rah {vals['Rah']:.2f} • Nonsense {vals['Nonsense']:.2f} • Men {vals['Men']:.2f} • Colors {vals['Colors']:.2f} • Opponents {vals['Opponents']:.2f}",
-                        style="margin:0;",
-                    ),
-                    style=f"padding:10px; border-left:6px solid {CONF_COLORS.get(c, '#444')}; margin-bottom:10px;",
-                )
-            )
+            blocks.append(f"""
+            <div style="padding:10px; border-left:6px solid {CONF_COLORS.get(c, '#444')}; margin-bottom:10px;">
+            <div style="margin-bottom:6px;">{conf_label(c)}</div>
+            <p style="margin:0;">Victory {vals['Victory/Win/Won']:.2f} • Fight {vals['Fight']:.2f} • Rah {vals['Rah']:.2f} • Nonsense {vals['Nonsense']:.2f} • Men {vals['Men']:.2f} • Colors {vals['Colors']:.2f} • Opponents {vals['Opponents']:.2f}</p>
+            </div>
+            """)
 
-        return ui.div(*blocks)
+        return ui.HTML(f"<div>{''.join(blocks)}</div>")
 
     @reactive.Effect
     def _keep_conf_selection_valid():
@@ -520,37 +820,7 @@ def server(input, output, session):
     
     @reactive.calc
     def conf_tables():
-        d = fight_songs_data()
-        if d is None:
-            return None
-
-        trope_cols = [
-            "victory_bool", "fight_bool", "rah_bool", "nonsense_bool",
-            "men_bool", "colors_bool", "opponents_bool"
-        ]
-
-        dd = d.dropna(subset=["conference"] + trope_cols).copy()
-        if dd.empty:
-            return None
-
-        conf_trope = (
-            dd.groupby("conference")[trope_cols]
-            .mean()
-            .rename(columns={
-                "victory_bool": "Victory/Win/Won",
-                "fight_bool": "Fight",
-                "rah_bool": "Rah",
-                "nonsense_bool": "Nonsense",
-                "men_bool": "Men",
-                "colors_bool": "Colors",
-                "opponents_bool": "Opponents",
-            })
-        )
-
-        conf_counts = dd.groupby("conference").size().sort_values(ascending=False)
-        top5 = conf_counts.head(5).index.tolist()
-
-        return conf_trope, conf_counts, top5
+        return _conf_tables()
 
     @output
     @render.plot
@@ -579,30 +849,51 @@ def server(input, output, session):
             ax.set_axis_off()
             return fig
 
-        labels = dims
-        angles = np.linspace(0, 2*np.pi, len(labels), endpoint=False)
-        angles = np.r_[angles, angles[0]]
+        labels = tuple(dims)
+        angles, theta_degrees = _radar_angles(len(labels))
 
-        fig, ax = plt.subplots(figsize=(6.2, 6.2), subplot_kw=dict(polar=True))
-        ax.set_ylim(0, 1)
-        ax.set_yticklabels([])
-        ax.grid(alpha=0.35)
-        ax.set_thetagrids(np.degrees(angles[:-1]), labels, fontsize=9)
+        size = plot_size()
 
-        for c in selected_confs:
-            vals = conf_trope.loc[c, labels].values.astype(float)
-            vals = np.r_[vals, vals[0]]
+        def draw():
+            if not _radar_cache:
+                _build_radar()
+            fig, ax = _radar_cache["fig"], _radar_cache["ax"]
+
+            def radar_values(c):
+                key = (c, labels)
+                if key not in _radar_cache["values"]:
+                    vals = conf_trope.loc[c, list(labels)].values.astype(float)
+                    _radar_cache["values"][key] = np.r_[vals, vals[0]]
+                return _radar_cache["values"][key]
 
-            color = CONF_COLORS.get(c, "#444444")
-            ax.plot(angles, vals, linewidth=2, color=color, label=f"{c} (n={int(conf_counts.get(c, 0))})")
-            ax.fill(angles, vals, alpha=0.18, color=color)
+            if _radar_cache["dims"] != labels:
+                ax.set_thetagrids(theta_degrees, labels, fontsize=9)
+                ax.set_yticklabels([])
+                _radar_cache["dims"] = labels
 
-        ax.legend(loc="upper left", bbox_to_anchor=(1.05, 1.05), frameon=False)
-        fig.tight_layout()
-        return fig
+            polys = [np.column_stack([angles, radar_values(c)]) for c in selected_confs]
+            colors = [CONF_COLORS.get(c, "#444444") for c in selected_confs]
+            _radar_cache["fills"].set_verts(polys)
+            _radar_cache["fills"].set_color(colors)
+            _radar_cache["outlines"].set_segments(polys)
+            _radar_cache["outlines"].set_color(colors)
 
+            # Collections have no per-polygon legend entries, so use proxies.
+            handles = [
+                Line2D([], [], linewidth=2, color=color, label=f"{c} (n={int(conf_counts.get(c, 0))})")
+                for c, color in zip(selected_confs, colors)
+            ]
+            ax.legend(handles=handles, loc="upper left", bbox_to_anchor=(1.05, 1.05), frameon=False)
+            return _fig_to_png(fig, *size)
+
+        return _cached_plot(("radar", tuple(selected_confs), labels) + size, draw)
 
 
 
 # ---------- App ----------
+# Build the shared tables at startup rather than in the first session.
+_conf_tables()
+_decade_props_full()
+_student_contest_props()
+
 app = App(app_ui, server, static_assets=Path(__file__).parent / "www")